@@ -2,6 +2,39 @@ import itertools
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+# Settings that influence values cached by django-modeltrans.
+_CACHED_SETTINGS = frozenset(
+    (
+        "LANGUAGE_CODE",
+        "LANGUAGES",
+        "MODELTRANS_ADD_FIELD_HELP_TEXT",
+        "MODELTRANS_AVAILABLE_LANGUAGES",
+        "MODELTRANS_DEFAULT_LANGUAGE",
+        "MODELTRANS_FALLBACK",
+    )
+)
+_cache_generation = 0
+
+
+def get_cache_generation():
+    """
+    Return the generation counter for caches derived from settings.
+
+    The counter is incremented whenever a setting django-modeltrans depends
+    on changes (for example with `override_settings` in tests), which allows
+    cached values to be discarded with a cheap equality check.
+    """
+    return _cache_generation
+
+
+@receiver(setting_changed)
+def _expire_caches(sender, setting, **kwargs):
+    global _cache_generation
+    if setting in _CACHED_SETTINGS:
+        _cache_generation += 1
 
 
 def get_modeltrans_setting(key):
@@ -16,8 +49,20 @@ def get_modeltrans_setting(key):
     return modeltrans_settings.get(key)
 
 
+_default_language = None
+_default_language_generation = -1
+
+
 def get_default_language():
-    return getattr(settings, "MODELTRANS_DEFAULT_LANGUAGE", getattr(settings, "LANGUAGE_CODE"))
+    global _default_language, _default_language_generation
+
+    if _default_language_generation != _cache_generation:
+        _default_language = getattr(
+            settings, "MODELTRANS_DEFAULT_LANGUAGE", getattr(settings, "LANGUAGE_CODE")
+        )
+        _default_language_generation = _cache_generation
+
+    return _default_language
 
 
 def get_available_languages_setting():
@@ -44,18 +89,28 @@ def get_available_languages_setting():
     return (lang for lang in languages if lang != get_default_language())
 
 
+_available_languages = None
+_available_languages_generation = -1
+
+
 def get_available_languages(include_default=True):
     """
-    Returns a tuple of available languages for django-modeltrans.
+    Returns a frozenset of available languages for django-modeltrans.
+
+    The frozenset is cached, as this is called (and its result tested for
+    membership) on every translated attribute access.
     """
-    MODELTRANS_AVAILABLE_LANGUAGES = get_available_languages_setting()
+    global _available_languages, _available_languages_generation
 
-    if include_default:
-        return tuple(
-            set(itertools.chain(MODELTRANS_AVAILABLE_LANGUAGES, (get_default_language(),)))
+    if _available_languages_generation != _cache_generation:
+        without_default = frozenset(get_available_languages_setting())
+        _available_languages = (
+            without_default,
+            frozenset(itertools.chain(without_default, (get_default_language(),))),
         )
-    else:
-        return MODELTRANS_AVAILABLE_LANGUAGES
+        _available_languages_generation = _cache_generation
+
+    return _available_languages[1] if include_default else _available_languages[0]
 
 
 def check_fallback_chain():
@@ -1,15 +1,23 @@
 from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
 from django.db.models import F, JSONField, fields
 from django.db.models.fields.json import KeyTextTransform
 from django.db.models.expressions import Case, When
 from django.db.models.functions import Cast, Coalesce
+from django.dispatch import receiver
 from django.utils.translation import gettext
 
-from .conf import get_default_language, get_fallback_chain, get_modeltrans_setting
+from .conf import (
+    get_available_languages,
+    get_cache_generation,
+    get_default_language,
+    get_fallback_chain,
+    get_modeltrans_setting,
+)
 from .utils import (
     FallbackTransform,
+    build_instance_field_value_getter,
     build_localized_fieldname,
-    get_instance_field_value,
     get_language,
     get_translated_field_label,
 )
@@ -18,6 +26,65 @@ SUPPORTED_FIELDS = (fields.CharField, fields.TextField, JSONField)
 
 GLOBAL_DEFAULT_LANGUAGE = get_default_language()
 
+# Cached value of the MODELTRANS_ADD_FIELD_HELP_TEXT setting, `None` when not
+# cached yet. The help_text property is called by the admin and forms for
+# every rendered field, so avoid a settings lookup per call.
+_add_field_help_text = None
+
+
+@receiver(setting_changed)
+def _update_cached_settings(sender, setting, **kwargs):
+    global GLOBAL_DEFAULT_LANGUAGE, _add_field_help_text
+
+    if setting in ("LANGUAGE_CODE", "MODELTRANS_DEFAULT_LANGUAGE"):
+        GLOBAL_DEFAULT_LANGUAGE = get_default_language()
+    elif setting == "MODELTRANS_ADD_FIELD_HELP_TEXT":
+        _add_field_help_text = None
+
+
+# Attributes of the original field read by Django's machinery (the ORM, forms
+# and the admin) on a virtual field. These are copied explicitly in
+# `TranslatedVirtualField.__init__` instead of copying the complete
+# `original_field.__dict__`. Not every attribute exists for every supported
+# field type or Django version (`encoder`/`decoder` are JSONField-only,
+# `choices`/`error_messages` are plain instance attributes on Django 4.2 but
+# properties backed by `_choices`/`_error_messages` on 5.x), missing ones are
+# simply skipped.
+_COPIED_FIELD_ATTRIBUTES = (
+    "_choices",
+    "_db_tablespace",
+    "_error_messages",
+    "_unique",
+    "_validators",
+    "_verbose_name",
+    "auto_created",
+    "choices",
+    "creation_counter",
+    "db_collation",
+    "db_column",
+    "db_comment",
+    "db_default",
+    "db_index",
+    "decoder",
+    "default",
+    "editable",
+    "encoder",
+    "error_messages",
+    "is_relation",
+    "max_length",
+    "primary_key",
+    "remote_field",
+    "serialize",
+    "unique_for_date",
+    "unique_for_month",
+    "unique_for_year",
+)
+
+_missing = object()
+
+
+_specific_class_cache = {}
+
 
 def translated_field_factory(original_field, language=None, default_language_field=None, *args, **kwargs):
     if not isinstance(original_field, SUPPORTED_FIELDS):
@@ -25,10 +92,28 @@ def translated_field_factory(original_field, language=None, default_language_fie
             "{} is not supported by django-modeltrans.".format(original_field.__class__.__name__)
         )
 
-    class Specific(TranslatedVirtualField, original_field.__class__):
-        pass
+    if (
+        language is not None
+        and language == GLOBAL_DEFAULT_LANGUAGE
+        and default_language_field is None
+    ):
+        # The explicit field for the default language only ever proxies the
+        # original field, use the specialized descriptor for it.
+        base = _DefaultLanguageVirtualField
+    else:
+        base = TranslatedVirtualField
+
+    # The generated class carries no state of its own, share it between all
+    # virtual fields with the same base and original field class.
+    key = (base, original_field.__class__)
+    Specific = _specific_class_cache.get(key)
+    if Specific is None:
 
-    Specific.__name__ = "Translated{}".format(original_field.__class__.__name__)
+        class Specific(base, original_field.__class__):
+            pass
+
+        Specific.__name__ = "Translated{}".format(original_field.__class__.__name__)
+        _specific_class_cache[key] = Specific
 
     return Specific(original_field, language, *args, default_language_field=default_language_field, **kwargs)
 
@@ -48,12 +133,29 @@ class TranslatedVirtualField:
     # https://github.com/djangonauts/django-hstore/blob/master/django_hstore/virtual.py
 
     def __init__(self, original_field, language=None, *args, default_language_field=None, **kwargs):
-        # TODO: this feels like a big hack.
-        self.__dict__.update(original_field.__dict__)
+        # The attribute snapshot is identical for every language-version of a
+        # translated field, so compute it once per original field and cache
+        # it on that field.
+        shared_attrs = original_field.__dict__.get("_modeltrans_shared_attrs")
+        if shared_attrs is None:
+            shared_attrs = {}
+            for attr in _COPIED_FIELD_ATTRIBUTES:
+                value = getattr(original_field, attr, _missing)
+                if value is not _missing:
+                    shared_attrs[attr] = value
+            original_field._modeltrans_shared_attrs = shared_attrs
+
+        for attr, value in shared_attrs.items():
+            setattr(self, attr, value)
 
         self.original_field = original_field
         self.language = language
         self.default_language_field = default_language_field
+        self._default_language_getter = (
+            build_instance_field_value_getter(default_language_field)
+            if default_language_field
+            else None
+        )
 
         self.blank = kwargs["blank"]
         self.null = kwargs["null"]
@@ -61,6 +163,20 @@ class TranslatedVirtualField:
         self.concrete = False
         self._help_text = kwargs.pop("help_text", None)
 
+        # Cache the localized fieldname for each language, as it is needed on
+        # every attribute access.
+        self._field_name_cache = {
+            language: build_localized_fieldname(self.original_name, language)
+            for language in get_available_languages()
+        }
+        self._i18n_field_name = build_localized_fieldname(self.original_name, "i18n")
+
+        self._fallback_plans = {}
+        self._fallback_plans_generation = get_cache_generation()
+
+        self._as_expression_cache = {}
+        self._as_expression_generation = get_cache_generation()
+
     @property
     def original_name(self):
         return self.original_field.name
@@ -70,12 +186,22 @@ class TranslatedVirtualField:
         if self._help_text is not None:
             return self._help_text
 
-        if get_modeltrans_setting("MODELTRANS_ADD_FIELD_HELP_TEXT") and self.language is None:
+        global _add_field_help_text
+        if _add_field_help_text is None:
+            _add_field_help_text = get_modeltrans_setting("MODELTRANS_ADD_FIELD_HELP_TEXT")
+
+        if _add_field_help_text and self.language is None:
             return gettext("current language: {}").format(get_language())
 
-    def contribute_to_class(self, cls, name):
+    def contribute_to_class(self, cls, name, expire_cache=True):
         self.model = cls
 
+        # The common case has no per-record fallback language, cache that so
+        # `__get__` can skip the whole branch with a single attribute test.
+        self._has_fallback_language_field = (
+            getattr(cls, "_modeltrans_fallback_language_field", None) is not None
+        )
+
         self.attname = name
         self.name = name
         self.column = None
@@ -86,12 +212,61 @@ class TranslatedVirtualField:
             translated_field_name = get_translated_field_label(translated_field_name, self.language)
         self.verbose_name = translated_field_name
 
+        # Record what `__set__` needs to know about this field in a table on
+        # the model class, so assignments to fields with an explicit language
+        # do not need to resolve the active language at all.
+        # Use `cls.__dict__` here: `getattr` could return (and then mutate)
+        # the table of a parent class.
+        set_table = cls.__dict__.get("_modeltrans_set_table")
+        if set_table is None:
+            set_table = {}
+            cls._modeltrans_set_table = set_table
+        set_table[name] = (
+            self.original_name,
+            self.language,
+            self.language is not None and self.default_language_field is None,
+        )
+
         setattr(cls, name, self)
-        cls._meta.add_field(self, private=True)
+        if expire_cache:
+            cls._meta.add_field(self, private=True)
+        else:
+            # What `Options.add_field(private=True)` does, minus the
+            # `_expire_cache()` call: `add_virtual_fields` adds many virtual
+            # fields in a row and expires the cache once afterwards.
+            cls._meta.private_fields.append(self)
 
     def db_type(self, connection):
         return None
 
+    def _localized_fieldname(self, language):
+        try:
+            return self._field_name_cache[language]
+        except KeyError:
+            # `language` was not available when this field was created
+            # (for example when using `override_settings` in tests).
+            return build_localized_fieldname(self.original_name, language)
+
+    def _get_fallback_plan(self, language):
+        """
+        Return a tuple of `(language, localized fieldname)` pairs to try, in
+        order, when looking up the value of the `<field>_i18n` version of
+        this field.
+        """
+        if self._fallback_plans_generation != get_cache_generation():
+            self._fallback_plans = {}
+            self._fallback_plans_generation = get_cache_generation()
+
+        plan = self._fallback_plans.get(language)
+        if plan is None:
+            plan = tuple(
+                (lang, self._localized_fieldname(lang))
+                for lang in (language,) + get_fallback_chain(language)
+            )
+            self._fallback_plans[language] = plan
+
+        return plan
+
     def get_instance_fallback_chain(self, instance, language):
         """
         Return the fallback chain for the instance.
@@ -101,11 +276,9 @@ class TranslatedVirtualField:
         """
         default = get_fallback_chain(language)
 
-        i18n_field = instance._meta.get_field("i18n")
-        if i18n_field.fallback_language_field:
-            record_fallback_language = get_instance_field_value(
-                instance, i18n_field.fallback_language_field
-            )
+        get_fallback_language = type(instance)._modeltrans_fallback_language_getter
+        if get_fallback_language is not None:
+            record_fallback_language = get_fallback_language(instance)
 
             if record_fallback_language:
                 return (record_fallback_language, *default)
@@ -118,7 +291,11 @@ class TranslatedVirtualField:
         if instance is None:
             return
 
-        if "i18n" in instance.get_deferred_fields():
+        # A deferred field is one whose attname is missing from the instance
+        # dict, so this test is equivalent to
+        # `"i18n" in instance.get_deferred_fields()` without walking all
+        # concrete fields on every access.
+        if "i18n" not in instance.__dict__:
             raise ValueError(
                 "Getting translated values on a model fetched with defer('i18n') is not supported."
             )
@@ -130,48 +307,70 @@ class TranslatedVirtualField:
             return original_value
 
         # Make sure we test for containment in a dict, not in None
-        if instance.i18n is None:
-            instance.i18n = {}
+        i18n = instance.i18n
+        if i18n is None:
+            i18n = instance.i18n = {}
 
-        field_name = build_localized_fieldname(self.original_name, language)
+        field_name = self._localized_fieldname(language)
 
         # Just return the value if this is an explicit field (<name>_<lang>)
         if self.language is not None:
-            return instance.i18n.get(field_name)
+            return i18n.get(field_name)
 
         # This is the _i18n version of the field, and the current language is not available,
         # so we walk the fallback chain:
-        for fallback_language in (language,) + self.get_instance_fallback_chain(instance, language):
+        if self._has_fallback_language_field:
+            # The fallback chain depends on a per-row fallback language, so
+            # the plan cannot be shared between instances.
+            plan = tuple(
+                (lang, self._localized_fieldname(lang))
+                for lang in (language,) + self.get_instance_fallback_chain(instance, language)
+            )
+        else:
+            plan = self._get_fallback_plan(language)
+
+        for fallback_language, field_name in plan:
             if fallback_language == default_language:
                 if original_value:
                     return original_value
                 else:
                     continue
 
-            field_name = build_localized_fieldname(self.original_name, fallback_language)
-            if field_name in instance.i18n and instance.i18n[field_name]:
-                return instance.i18n.get(field_name)
+            value = i18n.get(field_name)
+            if value:
+                return value
 
         # finally, return the original field if all else fails.
         return getattr(instance, self.original_name)
 
     def __set__(self, instance, value):
-        if instance.i18n is None:
-            instance.i18n = {}
+        i18n = instance.i18n
+        if i18n is None:
+            i18n = instance.i18n = {}
+
+        original_name, language, has_fixed_language = type(instance)._modeltrans_set_table[
+            self.name
+        ]
+
+        if has_fixed_language:
+            # An explicit language without default_language_field: comparing
+            # against the default language is a single equality check.
+            if language == GLOBAL_DEFAULT_LANGUAGE:
+                setattr(instance, original_name, value)
+                return
+        else:
+            language = self.get_language()
+            if language == self.get_default_language(instance):
+                setattr(instance, original_name, value)
+                return
 
-        language = self.get_language()
+        field_name = self._localized_fieldname(language)
 
-        default_language = self.get_default_language(instance)
-        if language == default_language:
-            setattr(instance, self.original_name, value)
+        # if value is None, remove field from `i18n`.
+        if value is None:
+            i18n.pop(field_name, None)
         else:
-            field_name = build_localized_fieldname(self.original_name, language)
-
-            # if value is None, remove field from `i18n`.
-            if value is None:
-                instance.i18n.pop(field_name, None)
-            else:
-                instance.i18n[field_name] = value
+            i18n[field_name] = value
 
     def get_field_name(self):
         """
@@ -181,11 +380,9 @@ class TranslatedVirtualField:
         translation or ``<original_field_name>_i18n`` for the currently active language.
         """
         if self.language is None:
-            lang = "i18n"
-        else:
-            lang = self.get_language()
+            return self._i18n_field_name
 
-        return build_localized_fieldname(self.original_name, lang)
+        return self._localized_fieldname(self.get_language())
 
     def get_language(self):
         """
@@ -210,12 +407,18 @@ class TranslatedVirtualField:
         return Field()
 
     def _localized_lookup(self, language, bare_lookup):
-        if not self.default_language_field and language == GLOBAL_DEFAULT_LANGUAGE:
-            return bare_lookup.replace(self.name, self.original_name)
+        # When accessing a table directly the lookup is just the field name,
+        # which saves rewriting the lookup with `str.replace`. Following
+        # relations, the related lookups come first.
+        if bare_lookup == self.name:
+            original_lookup = self.original_name
+            i18n_lookup = "i18n"
+        else:
+            original_lookup = bare_lookup.replace(self.name, self.original_name)
+            i18n_lookup = bare_lookup.replace(self.name, "i18n")
 
-        # When accessing a table directly, the i18_lookup will be just "i18n", while following relations
-        # they are in the lookup first.
-        i18n_lookup = bare_lookup.replace(self.name, "i18n")
+        if not self.default_language_field and language == GLOBAL_DEFAULT_LANGUAGE:
+            return original_lookup
 
         # To support per-row fallback languages, an F-expression is passed as language parameter.
         if isinstance(language, F):
@@ -223,9 +426,8 @@ class TranslatedVirtualField:
             field_prefix = build_localized_fieldname(self.original_name, "")
             return FallbackTransform(field_prefix, language, i18n_lookup)
         elif self.default_language_field:
-            default_value_field = bare_lookup.replace(self.name, self.original_name)
             return Case(
-                When(**{self.default_language_field: language}, then=default_value_field),
+                When(**{self.default_language_field: language}, then=original_lookup),
                 default=KeyTextTransform(
                     build_localized_fieldname(self.original_name, language), i18n_lookup
                 ),
@@ -239,8 +441,26 @@ class TranslatedVirtualField:
     def as_expression(self, bare_lookup, fallback=True):
         """
         Compose an expression to get the value for this virtual field in a query.
+
+        The expression for a given lookup, language and settings is
+        deterministic, so it is cached. Sharing the instance between queries
+        is fine: the compiler resolves expressions on a copy.
         """
         language = self.get_language()
+
+        if self._as_expression_generation != get_cache_generation():
+            self._as_expression_cache = {}
+            self._as_expression_generation = get_cache_generation()
+
+        key = (language, bare_lookup, fallback)
+        expression = self._as_expression_cache.get(key)
+        if expression is None:
+            expression = self._build_expression(language, bare_lookup, fallback)
+            self._as_expression_cache[key] = expression
+
+        return expression
+
+    def _build_expression(self, language, bare_lookup, fallback):
         if not self.default_language_field and language == GLOBAL_DEFAULT_LANGUAGE:
             return F(self._localized_lookup(language, bare_lookup))
 
@@ -248,30 +468,63 @@ class TranslatedVirtualField:
             i18n_lookup = self._localized_lookup(language, bare_lookup)
             return Cast(i18n_lookup, self.output_field())
 
+        if bare_lookup == self.name:
+            original_lookup = self.original_name
+        else:
+            original_lookup = bare_lookup.replace(self.name, self.original_name)
+
         fallback_chain = get_fallback_chain(language)
+        fallback_language_field = self.model._modeltrans_fallback_language_field
+
+        if not fallback_chain and not fallback_language_field:
+            # Nothing to fall back to but the original field, keep the
+            # generated SQL to a single two-branch COALESCE.
+            return Coalesce(
+                self._localized_lookup(language, bare_lookup),
+                original_lookup,
+                output_field=self.output_field(),
+            )
+
         # First, add the current language to the list of lookups
         lookups = [self._localized_lookup(language, bare_lookup)]
 
         # Optionnally add the lookup for the per-row fallback language
-        i18n_field = self.model._meta.get_field("i18n")
-        if i18n_field.fallback_language_field:
-            lookups.append(
-                self._localized_lookup(F(i18n_field.fallback_language_field), bare_lookup)
-            )
+        if fallback_language_field:
+            lookups.append(self._localized_lookup(F(fallback_language_field), bare_lookup))
 
         # and now, add the list of fallback languages to the lookup list
         for fallback_language in fallback_chain:
             lookups.append(self._localized_lookup(fallback_language, bare_lookup))
 
         # Add the original field as a fallback (might not be in the fallback chain)
-        lookups.append(bare_lookup.replace(self.name, self.original_name))
+        lookups.append(original_lookup)
 
         return Coalesce(*lookups, output_field=self.output_field())
 
     def get_default_language(self, instance):
-        if not self.default_language_field:
+        if self._default_language_getter is None:
             return GLOBAL_DEFAULT_LANGUAGE
-        return get_instance_field_value(instance, self.default_language_field)
+        return self._default_language_getter(instance)
+
+
+class _DefaultLanguageVirtualField(TranslatedVirtualField):
+    """
+    Specialized version of `TranslatedVirtualField` for the explicit
+    `<field>_<default_language>` field without a `default_language_field`.
+
+    Such a field only ever proxies the original field, so the language
+    branches in `__get__`/`__set__` are resolved once at class construction
+    instead of on every access.
+    """
+
+    def __get__(self, instance, instance_type=None):
+        if instance is None:
+            return
+
+        return getattr(instance, self.original_name)
+
+    def __set__(self, instance, value):
+        setattr(instance, self.original_name, value)
 
 
 class TranslationField(JSONField):
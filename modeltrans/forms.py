@@ -4,9 +4,8 @@ from django import forms
 from django.utils.translation import gettext
 
 from .conf import get_available_languages, get_default_language
-from .fields import get_instance_field_value
 from .translator import get_i18n_field
-from .utils import build_localized_fieldname, get_language
+from .utils import build_localized_fieldname, get_instance_field_value, get_language
 
 LANGUAGE_OPTIONS = ["browser", "fallback"]
 
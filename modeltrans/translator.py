@@ -5,7 +5,7 @@ from django.db.models import Manager
 from .conf import get_available_languages, get_default_language
 from .fields import TranslationField, translated_field_factory
 from .manager import MultilingualManager, transform_translatable_fields
-from .utils import get_model_field
+from .utils import build_instance_field_value_getter, get_model_field
 
 
 def get_i18n_field(Model):
@@ -60,6 +60,17 @@ def translate_model(Model):
 
     validate(Model)
 
+    # Make the i18n field and its per-record fallback configuration available
+    # as class attributes, so the virtual fields do not need to walk
+    # `_meta.get_field("i18n")` on every attribute access.
+    Model._modeltrans_i18n_field = i18n_field
+    Model._modeltrans_fallback_language_field = i18n_field.fallback_language_field
+    Model._modeltrans_fallback_language_getter = (
+        build_instance_field_value_getter(i18n_field.fallback_language_field)
+        if i18n_field.fallback_language_field
+        else None
+    )
+
     add_manager(Model)
     default_language_field = get_i18n_field_param(Model, i18n_field, "default_language_field")
     fields_to_translate = get_i18n_field_param(Model, i18n_field, "fields")
@@ -122,14 +133,15 @@ def validate(Model):
             raise ImproperlyConfigured('"required_languages" must be a tuple, list, set or dict')
 
 
-def raise_if_field_exists(Model, field_name):
+def raise_if_field_exists(Model, field_name, batch_field_names=frozenset()):
     if not hasattr(Model, field_name):
         return
 
-    try:
-        Model._meta.get_field(field_name)
-    except FieldDoesNotExist:
-        return
+    if field_name not in batch_field_names:
+        try:
+            Model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return
 
     raise ImproperlyConfigured(
         'Error adding translation field. Model "{}" already contains '
@@ -141,6 +153,17 @@ def add_virtual_fields(Model, default_language_field, fields, required_languages
     """
     Adds newly created translation fields to the given translation options.
     """
+    # Fields contributed in this batch are invisible to the stale _meta
+    # caches (they are only expired once, below), so collisions within the
+    # batch are tracked by name here.
+    batch_field_names = set()
+
+    def contribute_field(field):
+        name = field.get_field_name()
+        raise_if_field_exists(Model, name, batch_field_names)
+        field.contribute_to_class(Model, name, expire_cache=False)
+        batch_field_names.add(name)
+
     # Add virtual/proxy fields to assign values to and get values from.
     for field_name in fields:
         # if required_languages is dict, it contains an iterable of required languages
@@ -162,8 +185,7 @@ def add_virtual_fields(Model, default_language_field, fields, required_languages
             default_language_field=default_language_field,
         )
 
-        raise_if_field_exists(Model, field.get_field_name())
-        field.contribute_to_class(Model, field.get_field_name())
+        contribute_field(field)
 
         if default_language_field:
             # create field for global default language later on
@@ -180,8 +202,7 @@ def add_virtual_fields(Model, default_language_field, fields, required_languages
                 null=original_field.null,
                 editable=False,
             )
-            raise_if_field_exists(Model, field.get_field_name())
-            field.contribute_to_class(Model, field.get_field_name())
+            contribute_field(field)
 
         # now, for each language, add a virtual field to get the tranlation for
         # that specific langauge
@@ -195,8 +216,12 @@ def add_virtual_fields(Model, default_language_field, fields, required_languages
                 null=blank_allowed and original_field.null,
                 default_language_field=default_language_field,
             )
-            raise_if_field_exists(Model, field.get_field_name())
-            field.contribute_to_class(Model, field.get_field_name())
+            contribute_field(field)
+
+    # The virtual fields were appended without expiring the _meta caches
+    # (which would make adding N fields O(N^2)), expire them once.
+    if hasattr(Model._meta, "_expire_cache"):
+        Model._meta._expire_cache(reverse=False)
 
 
 def has_custom_queryset(manager):
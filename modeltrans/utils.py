@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from django.core.exceptions import FieldDoesNotExist
 from django.db.models.constants import LOOKUP_SEP
 from django.db.models.fields.json import KeyTransform
@@ -31,15 +33,23 @@ def get_translated_field_label(original_label, lang):
 
 
 def build_localized_fieldname(field_name, lang, ignore_default=False, default_language=None):
-    if default_language is None:
+    if ignore_default and default_language is None:
         default_language = get_default_language()
+    return _build_localized_fieldname(field_name, lang, ignore_default, default_language)
+
+
+@lru_cache(maxsize=None)
+def _build_localized_fieldname(field_name, lang, ignore_default, default_language):
+    # The set of (field_name, lang) pairs is small and bounded (translated
+    # fields x languages), while this is called on every translated attribute
+    # access, so the result is cached.
     if lang == "id":
         # The 2-letter Indonesian language code is problematic with the
         # current naming scheme as Django foreign keys also add "id" suffix.
         lang = "ind"
     if ignore_default and lang == default_language:
         return field_name
-    return "{}_{}".format(field_name, lang.replace("-", "_"))
+    return f"{field_name}_{lang.replace('-', '_')}"
 
 
 def get_model_field(model, path):
@@ -78,6 +88,33 @@ def get_instance_field_value(instance, path):
     return value
 
 
+def build_instance_field_value_getter(path):
+    """
+    Compile `get_instance_field_value()` for `path` into a closure.
+
+    Splitting the path can be done once this way, instead of on every access
+    when the same path is evaluated for many instances.
+    """
+    bits = path.split(LOOKUP_SEP)
+
+    if len(bits) == 1:
+
+        def getter(instance):
+            return getattr(instance, path, None)
+
+    else:
+
+        def getter(instance):
+            value = instance
+            for bit in bits:
+                value = getattr(value, bit, None)
+                if value is None:
+                    return None
+            return value
+
+    return getter
+
+
 class FallbackTransform(Transform):
     """
     Custom version of KeyTextTransform to use a database field as part of the key.
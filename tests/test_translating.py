@@ -114,6 +114,22 @@ class TranslateModelTest(TestCase):
         with self.assertRaisesMessage(ImproperlyConfigured, expected_message):
             translate_model(A)
 
+    def test_translate_duplicate_field(self):
+        class DuplicateFieldModel(models.Model):
+            title = models.CharField(max_length=100)
+
+            i18n = TranslationField(fields=("title", "title"))
+
+            class Meta:
+                app_label = "django-modeltrans_tests"
+
+        expected_message = (
+            'Error adding translation field. Model "DuplicateFieldModel" '
+            'already contains a field named "title_i18n".'
+        )
+        with self.assertRaisesMessage(ImproperlyConfigured, expected_message):
+            translate_model(DuplicateFieldModel)
+
     def test_translation_unsupported_field(self):
         class IntegerModel(models.Model):
             integer = models.IntegerField()